@@ -0,0 +1,17 @@
+# Production entrypoint: gunicorn -c gunicorn.conf.py app:app
+# Application is imported once in the master process and workers are forked
+# from it, so they share already imported and warmed module state
+from src import settings
+
+bind = f'0.0.0.0:{settings.PORT}'
+worker_class = 'uvicorn.workers.UvicornWorker'
+# Must stay 1: rooms, room_manager, connected clients and the leaderboard
+# live in process memory, players of one room on different workers would
+# never see each other. Restarts still benefit from the preloaded master
+workers = 1
+preload_app = True
+
+
+def on_starting(server):
+    # Build lazily loaded Jinja2 environment before the worker is forked
+    settings.templates
@@ -1,8 +1,22 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from starlette.applications import Starlette
 
 from src import settings
+from src.history import game_history
 from src.routes import routes
 
 
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    # Replay games history in background, server is ready right away and
+    # leaderboard views answer 503 until replay is finished
+    task = asyncio.create_task(game_history.load_leaderboard())
+    yield
+    task.cancel()
+
+
 def create_app() -> Starlette:
-    return Starlette(routes=routes, middleware=settings.middleware)
+    return Starlette(routes=routes, middleware=settings.middleware,
+                     lifespan=lifespan)
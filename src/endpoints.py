@@ -1,13 +1,46 @@
+import json
+import logging
+from collections import Counter
+from typing import Any, Type
+
 from starlette import status
 from starlette.endpoints import WebSocketEndpoint
+from starlette.types import Message
 
+from src.game import IncorrectMoveException
+from src.heartbeat import heartbeat
+from src.history import game_history
 from src.responses import (
     RESPONSE_CLOSE, RESPONSE_CONNECTED, ResponseEvent, build_chat_message,
     build_game_log, build_response
 )
 from src.rooms import WebsocketRoom, room_manager
+from src.schemas import (
+    ChatMessage, CreateRoom, EmptyPayload, MakeMove, Schema, ValidationError
+)
 from src.websockets import EnhancedWebscoket
 
+logger = logging.getLogger('uvicorn')
+
+# Returned by `decode` for frames that were rejected without dispatching
+REJECTED_FRAME = object()
+
+
+def dispatch_event(event_type: str, schema: Type[Schema] = EmptyPayload):
+    """Decorator that registers endpoint method as resolver of `event_type`
+    events. Incoming event data is validated against `schema` before the
+    resolver is called
+
+    Args:
+        event_type (str): Incoming event type
+        schema (Type[Schema], optional): Event data schema. Defaults to
+        EmptyPayload
+    """
+    def decorator(method):
+        method._dispatch_event = (event_type, schema)
+        return method
+    return decorator
+
 
 class BaseGameWebSocketEndpoint(WebSocketEndpoint):
     """
@@ -16,14 +49,36 @@ class BaseGameWebSocketEndpoint(WebSocketEndpoint):
     and outcoming requests. Adds client management functionality on connect,
     receive and disconnect events. 
 
+    Every connection is watched by HeartbeatMonitor, connections that stop
+    answering to pings are evicted through `evict` method which runs usual
+    `on_disconnect` cleanup.
+
     This class uses dispatch_methods class
     attribute to hold reference to event types and related resolver functions
-    through `dispatch_request` method. Resolver function must be async and
-    accept websocket and data as first arguments 
+    through `dispatch_request` method. Resolver function must be async,
+    accept websocket and data as first arguments and be registered with
+    `dispatch_event` decorator. Dispatch table is built once per subclass,
+    events that are not in the table or fail schema validation are rejected
+    and counted in `reject_counts` together with malformed JSON frames
     """
     encoding = 'json'
     clients = set()
     dispatch_methods = {}
+    reject_counts = Counter()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        resolvers = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                event = getattr(attr, '_dispatch_event', None)
+                if event:
+                    resolvers[event[0]] = (name, event[1])
+        # Resolve by name, so overriden methods are dispatched
+        cls.dispatch_methods = {
+            event_type: (getattr(cls, name), schema)
+            for event_type, (name, schema) in resolvers.items()
+        }
 
     def _get_old_connection(self, websocket: EnhancedWebscoket) -> EnhancedWebscoket:
         for client in self.clients:
@@ -31,17 +86,24 @@ class BaseGameWebSocketEndpoint(WebSocketEndpoint):
                 return client
         return None
 
+    @dispatch_event('pong')
+    async def on_pong(self, websocket: EnhancedWebscoket, data: dict) -> None:
+        """Heartbeat answer, connection is already marked alive on receive"""
+
+    @dispatch_event('chat_message', ChatMessage)
     async def on_chat_message(self, websocket: EnhancedWebscoket, data: dict) -> None:
         await self.broadcast_chat_message(data.get('message'), websocket)
 
     async def dispatch(self) -> None:
         """
         Overriden `dispatch` method which uses EnhancedWebsocket class instead
-        of default WebSocket. Any other functionality stayed intact
+        of default WebSocket and keeps connection registered in heartbeat
+        monitor. Any other functionality stayed intact
         """
         websocket = EnhancedWebscoket(
             self.scope, receive=self.receive, send=self.send)
         await self.on_connect(websocket)
+        heartbeat.watch(websocket, self.evict)
 
         close_code = status.WS_1000_NORMAL_CLOSURE
 
@@ -49,8 +111,10 @@ class BaseGameWebSocketEndpoint(WebSocketEndpoint):
             while True:
                 message = await websocket.receive()
                 if message["type"] == "websocket.receive":
+                    heartbeat.touch(websocket)
                     data = await self.decode(websocket, message)
-                    await self.on_receive(websocket, data)
+                    if data is not REJECTED_FRAME:
+                        await self.on_receive(websocket, data)
                 elif message["type"] == "websocket.disconnect":
                     close_code = int(message.get(
                         "code", status.WS_1000_NORMAL_CLOSURE))
@@ -59,7 +123,34 @@ class BaseGameWebSocketEndpoint(WebSocketEndpoint):
             close_code = status.WS_1011_INTERNAL_ERROR
             raise exc from None
         finally:
-            await self.on_disconnect(websocket, close_code)
+            heartbeat.unwatch(websocket)
+            # Evicted connections were already cleaned up
+            if not websocket.is_evicted:
+                await self.on_disconnect(websocket, close_code)
+
+    async def decode(self, websocket: EnhancedWebscoket, message: Message) -> Any:
+        """Rejects malformed JSON frames instead of closing connection"""
+        try:
+            return json.loads(message.get('text') or message.get('bytes') or '')
+        except ValueError:
+            await self.reject_request(
+                websocket, 'malformed_json', 'Malformed JSON data received')
+            return REJECTED_FRAME
+
+    async def evict(self, websocket: EnhancedWebscoket) -> None:
+        """Heartbeat callback for dead connections. Runs `on_disconnect`
+        cleanup right away and closes websocket without waiting for the client
+
+        Args:
+            websocket (EnhancedWebscoket): Connection that missed its pong
+        """
+        websocket.is_evicted = True
+        await self.on_disconnect(websocket, status.WS_1001_GOING_AWAY)
+        try:
+            await websocket.close(code=status.WS_1001_GOING_AWAY)
+        except Exception:
+            # Transport is already gone
+            pass
 
     async def dispatch_request(self, websocket: EnhancedWebscoket, data: dict):
         """Dispatcher for incoming messages through websocket.
@@ -75,15 +166,46 @@ class BaseGameWebSocketEndpoint(WebSocketEndpoint):
                 }
             ```
         """
+        if type(data) is not dict:
+            await self.reject_request(
+                websocket, 'not_an_object', 'Event must be a JSON object')
+            return
         event_type = data.get('event_type', None)
         # Issue a disconnect on empty event
-        # TODO: Add strict check for existing events only
         if not event_type:
+            self.reject_counts['missing_event'] += 1
             await websocket.send_json(RESPONSE_CLOSE)
             await websocket.close()
-        method = self.dispatch_methods.get(event_type, None)
-        if method:
-            await method(websocket=websocket, data=data.get('data', {}))
+            return
+        resolver = self.dispatch_methods.get(event_type, None) \
+            if type(event_type) is str else None
+        if not resolver:
+            await self.reject_request(
+                websocket, 'unknown_event', f'Unknown event {event_type}')
+            return
+        method, schema = resolver
+        try:
+            payload = schema.validate(data.get('data', {}))
+        except ValidationError as exc:
+            await self.reject_request(websocket, 'invalid_data', str(exc))
+            return
+        await method(self, websocket=websocket, data=payload)
+
+    async def reject_request(self, websocket: EnhancedWebscoket, reason: str,
+                             message: str) -> None:
+        """Count rejected request and notify sender about it
+
+        Args:
+            websocket (EnhancedWebscoket): Websocket that sent invalid data
+            reason (str): Reject counter key
+            message (str): Error message for sender
+        """
+        self.reject_counts[reason] += 1
+        logger.debug(f'Rejected request from {websocket}, {reason}: {message}')
+        await websocket.send_json(build_response(
+            event_type=ResponseEvent.EVENT_REJECTED,
+            message=message
+        ))
 
     async def on_receive(self, websocket: EnhancedWebscoket, data: dict) -> None:
         """Redirects any incoming data to internal request dispatcher
@@ -143,15 +265,9 @@ class MainServer(BaseGameWebSocketEndpoint):
     """
     room_manager = room_manager
 
-    @property
-    def dispatch_methods(self) -> dict:
-        return {
-            'chat_message': self.on_chat_message,
-            'create_room': self.create_room,
-        }
-
+    @dispatch_event('create_room', CreateRoom)
     async def create_room(self, websocket: EnhancedWebscoket, data: dict) -> None:
-        new_room = WebsocketRoom(data.get('name', None))
+        new_room = WebsocketRoom(data['name'])
         if new_room in self.room_manager:
             await websocket.send_json(build_response(
                 event_type=ResponseEvent.CREATE_ROOM_FAILED,
@@ -183,15 +299,7 @@ class GameRoomEndpoint(BaseGameWebSocketEndpoint):
     """
     room: WebsocketRoom = None
 
-    @property
-    def dispatch_methods(self) -> dict:
-        return {
-            'get_clients_count': self.get_room_clients_count,
-            'send_game_status': self.send_game_status,
-            'chat_message': self.on_chat_message,
-            'make_move': self.make_move
-        }
-
+    @dispatch_event('make_move', MakeMove)
     async def make_move(self, websocket: EnhancedWebscoket, data: dict) -> None:
         """Dispatcher method to process incoming game move data. Will return
         if current game is not available (either didn't start or finished).
@@ -200,8 +308,7 @@ class GameRoomEndpoint(BaseGameWebSocketEndpoint):
 
         Args:
             websocket (EnhancedWebscoket): Current player
-            data (dict): Data with game move. Keys with coordinates (x and y)
-            are expected.
+            data (dict): Data with game move, validated by MakeMove schema
         """
         if not self.room.game:
             await websocket.send_json(build_chat_message(
@@ -209,13 +316,14 @@ class GameRoomEndpoint(BaseGameWebSocketEndpoint):
             ))
             return
         try:
-            x, y = int(data.get('x')), int(data.get('y'))
+            x, y = data['x'], data['y']
             self.room.game.make_move(x, y, websocket)
             if self.room.game.winner:
                 await self.send_game_status()
                 await self.broadcast(build_game_log(
                     message=f'Game is finished, the winner is {self.room.game.winner}'
                 ))
+                game_history.record(self.room.game)
                 self.room.game = None
             else:
                 await self.broadcast(build_game_log(
@@ -223,7 +331,7 @@ class GameRoomEndpoint(BaseGameWebSocketEndpoint):
                 ))
                 await self.send_game_status()
                 return
-        except Exception as exc:
+        except IncorrectMoveException as exc:
             await websocket.send_json(build_game_log(message=str(exc)))
             return
 
@@ -232,19 +340,23 @@ class GameRoomEndpoint(BaseGameWebSocketEndpoint):
         for client in self.room.clients:
             await client.send_json(data)
 
+    @dispatch_event('get_clients_count')
     async def get_room_clients_count(self, websocket: EnhancedWebscoket, **kwargs) -> None:
         await websocket.send_json(build_response(
             event_type=ResponseEvent.GET_ROOM_CLIENTS_COUNT,
             data={'count': str(self.room.client_count)}
         ))
 
-    async def send_game_status(self) -> None:
+    @dispatch_event('send_game_status')
+    async def send_game_status(self, **kwargs) -> None:
         """Helper method to send updated game data"""
+        if not self.room.game:
+            return
         await self.broadcast(build_response(
             event_type='game_update',
             data={
                 "winner": self.room.game.winner,
-                "board": self.room.game.board.tolist()
+                "board": self.room.game.board
             }
         ))
 
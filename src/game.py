@@ -1,7 +1,5 @@
 from typing import Callable, List
 
-import numpy as np
-
 
 class IncorrectMoveException(Exception):
     pass
@@ -12,6 +10,8 @@ class Game:
     players: dict = None
     is_over = False
     winner = None
+    # Number of the winner, 0 for draw
+    result = None
     current_player = 1
 
     def __init__(self, players):
@@ -20,8 +20,8 @@ class Game:
         self.board = self._get_new_grid()
         self.players = dict(enumerate(players, 1))
 
-    def _get_new_grid(self) -> np.array:
-        return np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+    def _get_new_grid(self) -> List[List[int]]:
+        return [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
 
     def is_sequence_filled(self, sequence: list, player: int) -> bool:
         return len(set(sequence)) == 1 and player in set(sequence)
@@ -32,14 +32,14 @@ class Game:
 
     @property
     def board_rows(self) -> List:
-        return [[self.board[x, y] for y in range(len(self.board))]
+        return [[self.board[x][y] for y in range(len(self.board))]
                 for x in range(len(self.board))]
 
     def row_win(self, player: int) -> bool:
         for i in range(len(self.board)):
             row = []
             for j in range(len(self.board)):
-                row.append(self.board[i, j])
+                row.append(self.board[i][j])
             if self.is_sequence_filled(row, player):
                 return True
             continue
@@ -62,7 +62,7 @@ class Game:
     def diag_win(self, player: int) -> bool:
         diag = []
         for i in range(len(self.board)):
-            diag.append(self.board[i, i])
+            diag.append(self.board[i][i])
 
         if self.is_sequence_filled(diag, player):
             return True
@@ -71,7 +71,7 @@ class Game:
         j = 0
         for i in range(len(self.board)):
             j = len(self.board) - 1 - i
-            diag.append(self.board[i, j])
+            diag.append(self.board[i][j])
         if self.is_sequence_filled(diag, player):
             return True
         return False
@@ -82,9 +82,12 @@ class Game:
         try:
             if player != self.players[self.current_player]:
                 raise IncorrectMoveException("It's not your turn")
-            current_value = self.board[x, y]
+            # Negative indexes are valid for lists, but not for the board
+            if x < 0 or y < 0:
+                raise IndexError
+            current_value = self.board[x][y]
             if current_value == 0:
-                self.board[x, y] = self.current_player
+                self.board[x][y] = self.current_player
                 self.current_player = 2 if self.current_player == 1 else 1
                 return self.evaluate()
             else:
@@ -96,8 +99,10 @@ class Game:
         for player in self.players:
             if any(map(lambda f: f(player), self.conditions)):
                 self.winner = self.players[player].display_name
+                self.result = player
                 self.is_over = True
-        if np.all(self.board != 0) and not self.winner:
+        if all(all(row) for row in self.board) and not self.winner:
             self.winner = 'Noone'
+            self.result = 0
             self.is_over = True
         return self.winner
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from src import settings
+from src.responses import RESPONSE_PING
+from src.timers import TimerWheel
+from src.websockets import EnhancedWebscoket
+
+logger = logging.getLogger('uvicorn')
+
+EvictCallback = Callable[[EnhancedWebscoket], Awaitable[None]]
+
+
+class _Watch:
+    __slots__ = ('websocket', 'on_dead', 'awaiting_pong')
+
+    def __init__(self, websocket: EnhancedWebscoket, on_dead: EvictCallback):
+        self.websocket = websocket
+        self.on_dead = on_dead
+        self.awaiting_pong = False
+
+
+class HeartbeatMonitor:
+    """
+    Server driven ping/pong for websocket connections. Every watched
+    connection has exactly one timer in a TimerWheel. When a connection
+    stays silent for `interval` seconds it receives a ping event and has
+    `timeout` seconds to send anything back, otherwise `on_dead` callback
+    is called to evict it. Pings and evictions run as separate tasks limited
+    by `timeout`, so a stuck transport of one peer never blocks the others.
+
+    Background task is started on first watched connection and stops when
+    no connections are left
+    """
+
+    def __init__(self, interval: float = settings.HEARTBEAT_INTERVAL,
+                 timeout: float = settings.HEARTBEAT_TIMEOUT,
+                 tick: float = settings.HEARTBEAT_TICK):
+        self.interval = interval
+        self.timeout = timeout
+        self.wheel = TimerWheel(tick=tick)
+        self._watches = {}
+        self._task = None
+        # Running ping and eviction tasks
+        self._pending = set()
+
+    def watch(self, websocket: EnhancedWebscoket, on_dead: EvictCallback) -> None:
+        key = id(websocket)
+        self._watches[key] = _Watch(websocket, on_dead)
+        self.wheel.schedule(key, self.interval)
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def unwatch(self, websocket: EnhancedWebscoket) -> None:
+        key = id(websocket)
+        if self._watches.pop(key, None):
+            self.wheel.cancel(key)
+
+    def touch(self, websocket: EnhancedWebscoket) -> None:
+        """Mark connection as alive, any incoming frame counts as a pong"""
+        key = id(websocket)
+        watch = self._watches.get(key)
+        if watch:
+            watch.awaiting_pong = False
+            self.wheel.schedule(key, self.interval)
+
+    async def tick(self, now: float = None) -> None:
+        """Process expired timers: ping idle connections and evict the ones
+        that did not answer in time
+
+        Args:
+            now (float, optional): Current monotonic time
+        """
+        for key in self.wheel.advance(now):
+            watch = self._watches.get(key)
+            if not watch:
+                continue
+            if watch.awaiting_pong:
+                self._spawn(self._evict(key, watch))
+                continue
+            watch.awaiting_pong = True
+            self.wheel.schedule(key, self.timeout, now)
+            self._spawn(self._ping(key, watch))
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _ping(self, key: int, watch: _Watch) -> None:
+        try:
+            await asyncio.wait_for(
+                watch.websocket.send_json(RESPONSE_PING), self.timeout)
+        except Exception as exc:
+            logger.debug(f'Ping to {watch.websocket} failed: {exc!r}')
+            await self._evict(key, watch)
+
+    async def _evict(self, key: int, watch: _Watch) -> None:
+        # Connection may have been unwatched or evicted by another task
+        if self._watches.get(key) is not watch:
+            return
+        del self._watches[key]
+        self.wheel.cancel(key)
+        logger.info(f'Evicting dead connection {watch.websocket}')
+        try:
+            await asyncio.wait_for(watch.on_dead(watch.websocket), self.timeout)
+        except Exception as exc:
+            logger.warning(
+                f'Error during eviction of {watch.websocket}: {exc!r}')
+
+    async def _run(self) -> None:
+        try:
+            while self._watches:
+                await asyncio.sleep(self.wheel.tick)
+                await self.tick(time.monotonic())
+        finally:
+            self._task = None
+
+    def __len__(self):
+        return len(self._watches)
+
+    def __contains__(self, websocket):
+        return id(websocket) in self._watches
+
+
+heartbeat = HeartbeatMonitor()
@@ -0,0 +1,148 @@
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from src import settings
+from src.game import Game
+from src.leaderboard import Leaderboard
+
+logger = logging.getLogger('uvicorn')
+
+# Game.result to score of the first player
+SCORES = {0: 0.5, 1: 1.0, 2: 0.0}
+
+
+class GameHistory:
+    """
+    Append-only store of finished games. Every game is one compact JSON array
+    line in `path`:
+    ```
+        [finished_at, player1_id, player1_name, player2_id, player2_name, result]
+    ```
+    where player ids are public ids, not session uids, and result is the
+    number of the winner or 0 for draw. Store is read line by line, so export
+    and leaderboard replay use constant memory, lines that can not be parsed
+    (e.g. cut by a crash during write) are skipped.
+
+    Leaderboard is replayed from stored games by `load_leaderboard` in a
+    thread, `leaderboard` is None until it finishes. Afterwards it is updated
+    with every recorded game
+    """
+    # Lines per chunk of NDJSON export
+    chunk_size = 500
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._leaderboard = None
+        self._tail_checked = False
+
+    def record(self, game: Game) -> None:
+        """Store finished game and update leaderboard. Failed writes are only
+        logged, so storage problems never break a live game, and leaderboard
+        still counts the game until restart"""
+        player1, player2 = game.players[1], game.players[2]
+        record = [int(time.time()), player1.public_id, player1.display_name,
+                  player2.public_id, player2.display_name, game.result]
+        try:
+            self._append(json.dumps(record, separators=(',', ':')) + '\n')
+        except OSError as exc:
+            logger.error(f'Failed to store game in {self.path}: {exc!r}')
+        if self._leaderboard is not None:
+            self._update_leaderboard(self._leaderboard, record)
+
+    def _append(self, line: str) -> None:
+        # Appending a single short line is done synchronously on purpose,
+        # it is cheaper than a thread pool round trip
+        if not self._tail_checked:
+            # Do not glue new record to a line cut by previous crash
+            if self.path.exists() and self.path.stat().st_size:
+                with self.path.open('rb') as file:
+                    file.seek(-1, 2)
+                    if file.read(1) != b'\n':
+                        line = '\n' + line
+            self._tail_checked = True
+        with self.path.open('a') as file:
+            file.write(line)
+
+    def _update_leaderboard(self, leaderboard: Leaderboard, record: list) -> None:
+        _, id1, name1, id2, name2, result = record
+        leaderboard.record((id1, name1), (id2, name2), SCORES[result])
+
+    def _replay(self, leaderboard: Leaderboard, offset: int = 0) -> int:
+        """Apply stored games after byte `offset` to leaderboard
+
+        Returns:
+            int: Offset right after the last applied game
+        """
+        for offset, record in self._iter_records(offset):
+            self._update_leaderboard(leaderboard, record)
+        return offset
+
+    async def load_leaderboard(self) -> Leaderboard:
+        if self._leaderboard is None:
+            leaderboard = Leaderboard()
+            offset = await run_in_threadpool(self._replay, leaderboard)
+            # Games recorded during replay. `record` runs on the event loop
+            # too, so nothing can be appended before leaderboard is set
+            self._replay(leaderboard, offset)
+            self._leaderboard = leaderboard
+        return self._leaderboard
+
+    @property
+    def leaderboard(self) -> Optional[Leaderboard]:
+        return self._leaderboard
+
+    def _iter_records(self, offset: int = 0) -> Iterator[Tuple[int, list]]:
+        """Stored games after byte `offset`, each with offset of its line end.
+        Incomplete last line is left out"""
+        if not self.path.exists():
+            return
+        with self.path.open('rb') as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b'\n'):
+                    return
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    # Check record shape and result value
+                    _, _, _, _, _, result = record
+                    SCORES[result]
+                except (ValueError, TypeError, KeyError) as exc:
+                    logger.warning(
+                        f'Skipping malformed line ending at byte {offset} '
+                        f'of {self.path}: {exc!r}')
+                    continue
+                yield offset, record
+
+    def iter_records(self) -> Iterator[list]:
+        for _, record in self._iter_records():
+            yield record
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """Stored games as newline delimited JSON objects, in chunks of
+        `chunk_size` lines"""
+        chunk = []
+        for finished_at, id1, name1, id2, name2, result in self.iter_records():
+            chunk.append(json.dumps({
+                'finished_at': finished_at,
+                'players': [
+                    {'id': id1, 'name': name1},
+                    {'id': id2, 'name': name2},
+                ],
+                'winner': result,
+            }) + '\n')
+            if len(chunk) >= self.chunk_size:
+                yield ''.join(chunk)
+                chunk.clear()
+        if chunk:
+            yield ''.join(chunk)
+
+
+game_history = GameHistory(settings.HISTORY_FILE)
@@ -0,0 +1,188 @@
+import random
+from typing import Any, Iterator, List, Optional
+
+
+class _Node:
+    __slots__ = ('key', 'links', 'widths')
+
+    def __init__(self, key, level: int):
+        self.key = key
+        self.links = [None] * level
+        # Number of bottom level steps to the linked node
+        self.widths = [1] * level
+
+
+class SortedIndex:
+    """
+    Indexable skip list. Keeps unique comparable keys in sorted order, every
+    link also stores its width, so insert, remove, position lookup and
+    seeking to a position are O(log n) on average
+    """
+    max_level = 32
+
+    def __init__(self):
+        self._nil = _Node(None, 0)
+        self._head = _Node(None, self.max_level)
+        self._head.links = [self._nil] * self.max_level
+        self._size = 0
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.max_level and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _chain(self, key) -> List[_Node]:
+        """Last node before `key` on every level"""
+        chain = [None] * self.max_level
+        node = self._head
+        for level in reversed(range(self.max_level)):
+            while node.links[level] is not self._nil and node.links[level].key < key:
+                node = node.links[level]
+            chain[level] = node
+        return chain
+
+    def insert(self, key: Any) -> None:
+        chain = [None] * self.max_level
+        steps_at_level = [0] * self.max_level
+        node = self._head
+        for level in reversed(range(self.max_level)):
+            while node.links[level] is not self._nil and node.links[level].key < key:
+                steps_at_level[level] += node.widths[level]
+                node = node.links[level]
+            chain[level] = node
+        new_node = _Node(key, self._random_level())
+        steps = 0
+        for level in range(len(new_node.links)):
+            previous = chain[level]
+            new_node.links[level] = previous.links[level]
+            previous.links[level] = new_node
+            new_node.widths[level] = previous.widths[level] - steps
+            previous.widths[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(len(new_node.links), self.max_level):
+            chain[level].widths[level] += 1
+        self._size += 1
+
+    def remove(self, key: Any) -> None:
+        chain = self._chain(key)
+        node = chain[0].links[0]
+        if node is self._nil or node.key != key:
+            raise KeyError(key)
+        for level in range(len(node.links)):
+            previous = chain[level]
+            previous.widths[level] += node.widths[level] - 1
+            previous.links[level] = node.links[level]
+        for level in range(len(node.links), self.max_level):
+            chain[level].widths[level] -= 1
+        self._size -= 1
+
+    def index(self, key: Any) -> int:
+        """Zero based position of `key`
+
+        Raises:
+            KeyError: key is not in the index
+        """
+        position = 0
+        node = self._head
+        for level in reversed(range(self.max_level)):
+            while node.links[level] is not self._nil and node.links[level].key < key:
+                position += node.widths[level]
+                node = node.links[level]
+        node = node.links[0]
+        if node is self._nil or node.key != key:
+            raise KeyError(key)
+        return position
+
+    def _node_at(self, position: int) -> _Node:
+        node = self._head
+        position += 1
+        for level in reversed(range(self.max_level)):
+            while node.links[level] is not self._nil and node.widths[level] <= position:
+                position -= node.widths[level]
+                node = node.links[level]
+        return node
+
+    def iter_from(self, position: int = 0) -> Iterator[Any]:
+        """Iterate keys starting at `position`"""
+        if position >= self._size:
+            return
+        node = self._node_at(position)
+        while node is not self._nil:
+            yield node.key
+            node = node.links[0]
+
+    def __iter__(self):
+        return self.iter_from(0)
+
+    def __len__(self):
+        return self._size
+
+
+class Leaderboard:
+    """
+    Elo ratings of all players who finished at least one game. Ratings are
+    kept in SortedIndex ordered by rating, so top N and rank queries do not
+    need sorting of all players
+    """
+    initial_rating = 1500.0
+    k_factor = 32
+
+    def __init__(self):
+        self.ratings = {}
+        self.names = {}
+        self.index = SortedIndex()
+
+    def _set_rating(self, player_id: str, rating: float) -> None:
+        old_rating = self.ratings.get(player_id)
+        if old_rating is not None:
+            self.index.remove((-old_rating, player_id))
+        self.ratings[player_id] = rating
+        self.index.insert((-rating, player_id))
+
+    def record(self, player1: tuple, player2: tuple, score: float) -> None:
+        """Update ratings with result of a single game
+
+        Args:
+            player1 (tuple): Pair of public player id and display name
+            player2 (tuple): Pair of public player id and display name
+            score (float): Score of the first player: 1 for win, 0.5 for
+            draw and 0 for loss
+        """
+        (player_id1, name1), (player_id2, name2) = player1, player2
+        self.names[player_id1], self.names[player_id2] = name1, name2
+        rating1 = self.ratings.get(player_id1, self.initial_rating)
+        rating2 = self.ratings.get(player_id2, self.initial_rating)
+        expected = 1 / (1 + 10 ** ((rating2 - rating1) / 400))
+        delta = self.k_factor * (score - expected)
+        self._set_rating(player_id1, rating1 + delta)
+        self._set_rating(player_id2, rating2 - delta)
+
+    def _entry(self, player_id: str, position: int) -> dict:
+        return {
+            'rank': position + 1,
+            'id': player_id,
+            'name': self.names[player_id],
+            'rating': round(self.ratings[player_id]),
+        }
+
+    def top(self, limit: int = 10, offset: int = 0) -> List[dict]:
+        """Page of leaderboard entries, skipping `offset` best players"""
+        entries = []
+        keys = self.index.iter_from(offset)
+        for position, (_, player_id) in zip(range(offset, offset + limit), keys):
+            entries.append(self._entry(player_id, position))
+        return entries
+
+    def get(self, player_id: str) -> Optional[dict]:
+        """Leaderboard entry with rank of player or None for unknown player"""
+        rating = self.ratings.get(player_id)
+        if rating is None:
+            return None
+        return self._entry(player_id, self.index.index((-rating, player_id)))
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, player_id):
+        return player_id in self.ratings
@@ -21,6 +21,9 @@ class ResponseEvent(Enum):
     GAME_UPDATE = 'game_update'
     GAME_LOG = 'game_log'
 
+    PING = 'ping'
+    EVENT_REJECTED = 'event_rejected'
+
 
 def build_response(event_type: str, data: dict = None, message: str = None,
                    websocket: EnhancedWebscoket = None) -> dict:
@@ -52,3 +55,5 @@ RESPONSE_CLOSE = build_response(
     event_type=ResponseEvent.CONNECTION_CLOSE,
     message='Client disconnected'
 )
+
+RESPONSE_PING = build_response(event_type=ResponseEvent.PING)
@@ -3,10 +3,16 @@ from starlette.routing import Mount, Route, WebSocketRoute
 from starlette.staticfiles import StaticFiles
 
 from src.endpoints import GameRoomEndpoint, MainServer
-from src.views import Homepage
+from src.views import (
+    GameHistoryView, Homepage, LeaderboardView, PlayerRankView, RejectStatsView
+)
 
 routes = [
     Route("/", Homepage),
+    Route("/history", GameHistoryView),
+    Route("/leaderboard", LeaderboardView),
+    Route("/leaderboard/{player_id:str}", PlayerRankView),
+    Route("/stats/rejects", RejectStatsView),
     WebSocketRoute("/ws", MainServer),
     WebSocketRoute("/ws/{room:str}", GameRoomEndpoint),
     Mount('/static', app=StaticFiles(directory='static'), name='static'),
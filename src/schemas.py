@@ -0,0 +1,107 @@
+from typing import Any, Callable, Tuple
+
+MISSING = object()
+
+
+class ValidationError(Exception):
+    pass
+
+
+class Field:
+    """
+    Optional field declaration with default value and constraints. Plain
+    annotated attributes without Field are required fields
+    """
+    __slots__ = ('default', 'min_value', 'max_value', 'min_length', 'max_length')
+
+    def __init__(self, default: Any = MISSING, min_value=None, max_value=None,
+                 min_length: int = None, max_length: int = None):
+        self.default = default
+        self.min_value = min_value
+        self.max_value = max_value
+        self.min_length = min_length
+        self.max_length = max_length
+
+
+def _compile(fields: Tuple[Tuple[str, type, Field], ...]) -> Callable[[dict], dict]:
+    """Generate validator source for given fields, so every field check is
+    inlined and only declared constraints are evaluated"""
+    namespace = {'MISSING': MISSING, 'ValidationError': ValidationError}
+    lines = [
+        'def validate(data):',
+        '    if type(data) is not dict:',
+        "        raise ValidationError('Event data must be an object')",
+    ]
+    for i, (name, type_, field) in enumerate(fields):
+        value, kind = f'_{i}', f'_type_{i}'
+        namespace[kind] = type_
+        if type_ is float:
+            conditions = [f'type({value}) not in (int, float)']
+        else:
+            # Exact type match, so booleans are not accepted as integers
+            conditions = [f'type({value}) is not {kind}']
+        for attr, template in (('min_value', '{} < {}'), ('max_value', '{} > {}'),
+                               ('min_length', 'len({}) < {}'),
+                               ('max_length', 'len({}) > {}')):
+            limit = getattr(field, attr)
+            if limit is not None:
+                namespace[f'_{attr}_{i}'] = limit
+                conditions.append(template.format(value, f'_{attr}_{i}'))
+        lines.append(f'    {value} = data.get({name!r}, MISSING)')
+        lines.append(f'    if {value} is MISSING:')
+        if field.default is MISSING:
+            lines.append(
+                f"        raise ValidationError('Field `{name}` is required')")
+        else:
+            namespace[f'_default_{i}'] = field.default
+            lines.append(f'        {value} = _default_{i}')
+        lines.append(f"    elif {' or '.join(conditions)}:")
+        lines.append(
+            f"        raise ValidationError('Invalid value for field `{name}`')")
+    items = ', '.join(f'{name!r}: _{i}' for i, (name, _, _) in enumerate(fields))
+    lines.append(f'    return {{{items}}}')
+    exec('\n'.join(lines), namespace)
+    return namespace['validate']
+
+
+class Schema:
+    """
+    Declarative event payload schema. Annotated class attributes become
+    fields and are compiled into generated `validate` function once, on class
+    creation:
+    ```
+        class MakeMove(Schema):
+            x: int = Field(min_value=0)
+            y: int = Field(min_value=0)
+    ```
+    `validate` accepts raw event data and returns new dictionary with declared
+    fields only, unknown keys are dropped
+    """
+    validate: Callable[[dict], dict] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for name, type_ in cls.__dict__.get('__annotations__', {}).items():
+            field = cls.__dict__.get(name, MISSING)
+            if not isinstance(field, Field):
+                field = Field(default=field)
+            fields.append((name, type_, field))
+        cls.validate = staticmethod(_compile(tuple(fields)))
+
+
+class EmptyPayload(Schema):
+    pass
+
+
+class ChatMessage(Schema):
+    message: str = Field(min_length=1, max_length=1000)
+
+
+class CreateRoom(Schema):
+    name: str = Field(min_length=1, max_length=100)
+
+
+class MakeMove(Schema):
+    x: int = Field(min_value=0)
+    y: int = Field(min_value=0)
@@ -2,7 +2,6 @@ from starlette.config import Config
 from starlette.datastructures import Secret
 from starlette.middleware import Middleware
 from starlette.middleware.sessions import SessionMiddleware
-from starlette.templating import Jinja2Templates
 
 from src.middleware import SessionUIDMiddleware
 
@@ -12,18 +11,38 @@ config = Config('.env')
 DEBUG = config('DEBUG', cast=bool, default=False)
 
 # Application secret
-SECRET_KEY = config('SECRET', cast=Secret, default=None)
+SECRET_KEY = config('SECRET_KEY', cast=Secret,
+                    default=config('SECRET', default=None))
 
 # Current host and port
 HOST = config('HOST', cast=str, default='localhost')
 PORT = config('PORT', cast=int, default='8000')
 ADDRESS = f'{HOST}:{PORT}'
 
-# Templates
-templates = Jinja2Templates(directory='templates')
+# Websocket heartbeat, in seconds. Idle connections receive a ping after
+# HEARTBEAT_INTERVAL and are evicted if silent for HEARTBEAT_TIMEOUT more
+HEARTBEAT_INTERVAL = config('HEARTBEAT_INTERVAL', cast=float, default=20.0)
+HEARTBEAT_TIMEOUT = config('HEARTBEAT_TIMEOUT', cast=float, default=10.0)
+HEARTBEAT_TICK = config('HEARTBEAT_TICK', cast=float, default=1.0)
+
+# File with finished games history
+HISTORY_FILE = config('HISTORY_FILE', cast=str, default='history.ndjson')
+
+# Templates directory. Jinja2 environment is created on first access to
+# `settings.templates`, see module level `__getattr__` below
+TEMPLATES_DIR = 'templates'
 
 # Middleware
 middleware = [
     Middleware(SessionMiddleware, secret_key=SECRET_KEY),
     Middleware(SessionUIDMiddleware)
 ]
+
+
+def __getattr__(name):
+    # Lazy module attributes, keeps Jinja2 out of worker startup
+    if name == 'templates':
+        from starlette.templating import Jinja2Templates
+        globals()['templates'] = Jinja2Templates(directory=TEMPLATES_DIR)
+        return globals()['templates']
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
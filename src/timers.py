@@ -0,0 +1,94 @@
+import math
+import time
+from typing import Hashable, List
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel. Timers are placed into one of `size` slots based on
+    their deadline and carry a number of remaining wheel revolutions, so
+    scheduling, rescheduling and cancelling a timer are O(1) operations and
+    each tick only touches timers hashed into the current slot.
+
+    Timers are identified by hashable keys, scheduling an already existing key
+    moves the timer to the new deadline
+    """
+
+    def __init__(self, tick: float = 1.0, size: int = 512, now: float = None):
+        if tick <= 0 or size <= 0:
+            raise ValueError('Timer wheel tick and size must be positive')
+        self.tick = tick
+        self.size = size
+        self._slots = [dict() for _ in range(size)]
+        # Key -> slot index, used for O(1) cancel
+        self._index = {}
+        self._cursor = 0
+        self._time = time.monotonic() if now is None else now
+
+    def schedule(self, key: Hashable, delay: float, now: float = None) -> None:
+        """Schedule (or reschedule) timer `key` to expire after `delay` seconds
+
+        Args:
+            key (Hashable): Unique timer identifier
+            delay (float): Delay in seconds
+            now (float, optional): Current monotonic time
+        """
+        self.cancel(key)
+        now = time.monotonic() if now is None else now
+        if not self._index:
+            # Empty wheel may have been idle, start new timer from `now`
+            self._skip_idle(now)
+        # Count ticks from the last processed tick, so lagging `advance`
+        # calls still expire the timer on the right tick
+        ticks = max(1, math.ceil((now - self._time + delay) / self.tick))
+        slot = (self._cursor + ticks) % self.size
+        self._slots[slot][key] = (ticks - 1) // self.size
+        self._index[key] = slot
+
+    def _skip_idle(self, now: float) -> None:
+        """Move empty wheel up to `now` at once, nothing can expire on the
+        way"""
+        skipped = math.floor((now - self._time) / self.tick)
+        if skipped > 0:
+            self._time += skipped * self.tick
+            self._cursor = (self._cursor + skipped) % self.size
+
+    def cancel(self, key: Hashable) -> bool:
+        slot = self._index.pop(key, None)
+        if slot is None:
+            return False
+        del self._slots[slot][key]
+        return True
+
+    def advance(self, now: float = None) -> List[Hashable]:
+        """Move the wheel up to `now` and return keys of expired timers
+
+        Args:
+            now (float, optional): Current monotonic time
+
+        Returns:
+            List[Hashable]: Expired keys in order of expiration
+        """
+        now = time.monotonic() if now is None else now
+        expired = []
+        if not self._index:
+            self._skip_idle(now)
+            return expired
+        while self._time + self.tick <= now:
+            self._time += self.tick
+            self._cursor = (self._cursor + 1) % self.size
+            slot = self._slots[self._cursor]
+            for key, rounds in list(slot.items()):
+                if rounds:
+                    slot[key] = rounds - 1
+                else:
+                    del slot[key]
+                    del self._index[key]
+                    expired.append(key)
+        return expired
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
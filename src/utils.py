@@ -1,4 +1,3 @@
-import aiohttp
 import logging
 
 logger = logging.getLogger('uvicorn')
@@ -12,6 +11,8 @@ async def get_ngrok_http_tunnel() -> str:
     """
     host = None
     try:
+        # Development helper only, keep aiohttp out of app startup
+        import aiohttp
         async with aiohttp.ClientSession() as session:
             response = await session.get('http://127.0.0.1:4040/api/tunnels')
             data = await response.json()
@@ -1,6 +1,11 @@
+from typing import Optional
+
 from starlette.endpoints import HTTPEndpoint
+from starlette.responses import JSONResponse, StreamingResponse
 
 from src import settings
+from src.endpoints import BaseGameWebSocketEndpoint
+from src.history import game_history
 
 
 class Homepage(HTTPEndpoint):
@@ -9,3 +14,59 @@ class Homepage(HTTPEndpoint):
             'index.html', {'request': request, 'host': settings.ADDRESS}
         )
         return response
+
+
+def get_int_param(request, name: str, default: int, min_value: int,
+                  max_value: int = None) -> Optional[int]:
+    """Integer query parameter in given range, None for invalid value"""
+    try:
+        value = int(request.query_params.get(name, default))
+    except ValueError:
+        return None
+    if value < min_value or (max_value is not None and value > max_value):
+        return None
+    return value
+
+
+def leaderboard_loading() -> JSONResponse:
+    return JSONResponse({'message': 'Leaderboard is loading'}, status_code=503)
+
+
+class GameHistoryView(HTTPEndpoint):
+    async def get(self, request):
+        return StreamingResponse(
+            game_history.iter_ndjson(), media_type='application/x-ndjson')
+
+
+class LeaderboardView(HTTPEndpoint):
+    async def get(self, request):
+        limit = get_int_param(request, 'limit', 10, 1, 100)
+        if limit is None:
+            return JSONResponse(
+                {'message': '`limit` must be an integer from 1 to 100'},
+                status_code=400)
+        offset = get_int_param(request, 'offset', 0, 0)
+        if offset is None:
+            return JSONResponse(
+                {'message': '`offset` must be a non-negative integer'},
+                status_code=400)
+        if game_history.leaderboard is None:
+            return leaderboard_loading()
+        return JSONResponse({
+            'players': game_history.leaderboard.top(limit, offset)
+        })
+
+
+class PlayerRankView(HTTPEndpoint):
+    async def get(self, request):
+        if game_history.leaderboard is None:
+            return leaderboard_loading()
+        entry = game_history.leaderboard.get(request.path_params['player_id'])
+        if not entry:
+            return JSONResponse({'message': 'Player not found'}, status_code=404)
+        return JSONResponse(entry)
+
+
+class RejectStatsView(HTTPEndpoint):
+    async def get(self, request):
+        return JSONResponse(dict(BaseGameWebSocketEndpoint.reject_counts))
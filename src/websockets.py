@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from uuid import uuid4
 
@@ -6,12 +7,20 @@ from starlette.websockets import WebSocket
 logger = logging.getLogger('uvicorn')
 
 
+def get_public_id(uid: str) -> str:
+    """Public player id derived from session uid. Session uid identifies
+    the player in rooms and games, so it must never leave the server"""
+    return hashlib.sha256(uid.encode()).hexdigest()[:16]
+
+
 class EnhancedWebscoket(WebSocket):
     """
     Starlette's WebSocket object with additional methods and unique ID
     """
     _uid = None
     _display_name = None
+    # Set when connection was dropped by heartbeat monitor
+    is_evicted = False
 
     @property
     def uid(self):
@@ -27,6 +36,10 @@ class EnhancedWebscoket(WebSocket):
                 self._uid = uid
         return self._uid
 
+    @property
+    def public_id(self):
+        return get_public_id(self.uid)
+
     @property
     def display_name(self):
         if not self._display_name:
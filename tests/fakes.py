@@ -0,0 +1,6 @@
+class FakeWebsocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
@@ -6,6 +6,7 @@ from src.game import Game, IncorrectMoveException
 class FakePlayer:
     def __init__(self, uid):
         self.uid = uid
+        self.public_id = f'public-{uid}'
         self.display_name = uid
 
 
@@ -26,3 +27,8 @@ class GameTestCase(TestCase):
 
         self.assertTrue(game.winner)
         self.assertTrue(game.is_over)
+
+    def test_incorrect_coordinates(self):
+        for x, y in ((-1, 0), (0, 3)):
+            with self.assertRaises(IncorrectMoveException):
+                self.game.make_move(x, y, self.player1)
@@ -0,0 +1,112 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from src.endpoints import GameRoomEndpoint
+from src.heartbeat import HeartbeatMonitor
+from src.rooms import WebsocketRoom, room_manager
+
+from tests.fakes import FakeWebsocket
+
+
+class StuckWebsocket(FakeWebsocket):
+    """Half-open connection with full write buffer"""
+
+    async def send_json(self, data):
+        await asyncio.Event().wait()
+
+
+class HeartbeatMonitorTestCase(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.monitor = HeartbeatMonitor(interval=2, timeout=1, tick=1)
+        self.evicted = []
+        self.websocket = FakeWebsocket()
+        self.monitor.watch(self.websocket, self.on_dead)
+        self.start = self.monitor.wheel._time
+
+    async def asyncTearDown(self):
+        self.monitor.unwatch(self.websocket)
+
+    async def on_dead(self, websocket):
+        self.evicted.append(websocket)
+
+    async def tick(self, now):
+        await self.monitor.tick(now)
+        await asyncio.gather(*self.monitor._pending)
+
+    async def test_dead_connection_evicted(self):
+        await self.tick(self.start + 3)
+        self.assertEqual(self.websocket.sent[0]['event_type'], 'ping')
+        self.assertEqual(self.evicted, [])
+        await self.tick(self.start + 5)
+        self.assertEqual(self.evicted, [self.websocket])
+        self.assertNotIn(self.websocket, self.monitor)
+
+    async def test_pong_keeps_connection(self):
+        await self.tick(self.start + 3)
+        self.monitor.touch(self.websocket)
+        await self.tick(self.start + 5)
+        self.assertEqual(self.evicted, [])
+        self.assertIn(self.websocket, self.monitor)
+
+    async def test_stuck_peer_does_not_block_tick(self):
+        self.monitor.timeout = 0.01
+        stuck = StuckWebsocket()
+        self.monitor.watch(stuck, self.on_dead)
+
+        await asyncio.wait_for(self.monitor.tick(self.start + 3), 0.1)
+        self.assertEqual(self.websocket.sent[0]['event_type'], 'ping')
+        await asyncio.gather(*self.monitor._pending)
+        self.assertEqual(self.evicted, [stuck])
+
+
+class EvictedRoomEndpoint(GameRoomEndpoint):
+    disconnects = 0
+
+    async def on_disconnect(self, websocket, close_code):
+        EvictedRoomEndpoint.disconnects += 1
+        await super().on_disconnect(websocket, close_code)
+
+
+class EndpointEvictionTestCase(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        monitor = HeartbeatMonitor(interval=0.05, timeout=0.05, tick=0.01)
+        patcher = patch('src.endpoints.heartbeat', monitor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.room = WebsocketRoom('eviction')
+        room_manager.create_room(self.room)
+        self.addCleanup(room_manager.remove_room, self.room)
+
+    async def test_dead_client_removed_from_room(self):
+        incoming, sent = asyncio.Queue(), []
+        scope = {
+            'type': 'websocket', 'path': '/ws/eviction', 'headers': [],
+            'query_string': b'', 'path_params': {'room': 'eviction'},
+            'session': {'uid': 'dead-client'},
+        }
+        endpoint = EvictedRoomEndpoint(scope, incoming.get, self.send_to(sent))
+        await incoming.put({'type': 'websocket.connect'})
+        # Client never answers after connecting, like a half-open connection
+        dispatch = asyncio.create_task(endpoint.dispatch())
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if sent[-1]['type'] == 'websocket.close':
+                break
+        self.assertEqual(sent[-1]['type'], 'websocket.close')
+        self.assertEqual(sent[-1]['code'], 1001)
+        self.assertIn('"ping"', ''.join(x.get('text', '') for x in sent))
+        self.assertEqual(self.room.client_count, 0)
+        self.assertEqual(EvictedRoomEndpoint.disconnects, 1)
+
+        await incoming.put({'type': 'websocket.disconnect', 'code': 1006})
+        await asyncio.wait_for(dispatch, 1)
+        self.assertEqual(EvictedRoomEndpoint.disconnects, 1)
+
+    def send_to(self, sent):
+        async def send(message):
+            sent.append(message)
+        return send
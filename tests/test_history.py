@@ -0,0 +1,77 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import IsolatedAsyncioTestCase
+
+from src.game import Game
+from src.history import GameHistory
+
+from tests.test_game import FakePlayer
+
+
+class GameHistoryTestCase(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'history.ndjson'
+        self.history = GameHistory(self.path)
+        self.player1, self.player2 = FakePlayer('1'), FakePlayer('2')
+
+    def play_game(self) -> Game:
+        game = Game([self.player1, self.player2])
+        for x, y in ((0, 0), (2, 2), (0, 1), (2, 1), (0, 2)):
+            game.make_move(x, y, game.players[game.current_player])
+        return game
+
+    def test_record_and_export(self):
+        self.history.record(self.play_game())
+        self.history.record(self.play_game())
+
+        lines = ''.join(self.history.iter_ndjson()).splitlines()
+        self.assertEqual(len(lines), 2)
+        record = json.loads(lines[0])
+        self.assertEqual(record['winner'], 1)
+        self.assertEqual([x['id'] for x in record['players']],
+                         ['public-1', 'public-2'])
+        self.assertEqual(set(record['players'][0]), {'id', 'name'})
+
+    async def test_leaderboard_replay(self):
+        self.history.record(self.play_game())
+        self.assertIsNone(self.history.leaderboard)
+        leaderboard = await self.history.load_leaderboard()
+        self.assertEqual(leaderboard.get('public-1')['rank'], 1)
+
+        self.history.record(self.play_game())
+        replayed = await GameHistory(self.path).load_leaderboard()
+        self.assertEqual(replayed.ratings, leaderboard.ratings)
+
+    async def test_empty_history(self):
+        self.assertEqual(list(self.history.iter_ndjson()), [])
+        self.assertEqual(len(await self.history.load_leaderboard()), 0)
+
+    async def test_malformed_lines_skipped(self):
+        self.history.record(self.play_game())
+        with self.path.open('a') as file:
+            file.write('[1,"1","1"')
+        self.history = GameHistory(self.path)
+        self.history.record(self.play_game())
+
+        self.assertEqual(len(list(self.history.iter_records())), 2)
+        self.assertEqual(len(await self.history.load_leaderboard()), 2)
+
+    async def test_failed_write_keeps_leaderboard(self):
+        history = GameHistory(Path(self.path.parent, 'missing', 'history.ndjson'))
+        await history.load_leaderboard()
+
+        with self.assertLogs('uvicorn', 'ERROR'):
+            history.record(self.play_game())
+        self.assertIn('public-1', history.leaderboard)
+
+    def test_export_chunks(self):
+        self.history.chunk_size = 2
+        for _ in range(3):
+            self.history.record(self.play_game())
+
+        chunks = list(self.history.iter_ndjson())
+        self.assertEqual([x.count('\n') for x in chunks], [2, 1])
@@ -0,0 +1,57 @@
+import random
+from unittest import TestCase
+
+from src.leaderboard import Leaderboard, SortedIndex
+
+
+class SortedIndexTestCase(TestCase):
+
+    def test_matches_sorted_list(self):
+        index, expected = SortedIndex(), []
+        keys = random.sample(range(10000), 500)
+        for key in keys:
+            index.insert(key)
+            expected.append(key)
+        for key in keys[::3]:
+            index.remove(key)
+            expected.remove(key)
+        expected.sort()
+
+        self.assertEqual(list(index), expected)
+        self.assertEqual(len(index), len(expected))
+        for position in (0, 17, len(expected) - 1):
+            self.assertEqual(index.index(expected[position]), position)
+            self.assertEqual(list(index.iter_from(position)), expected[position:])
+
+    def test_missing_key(self):
+        index = SortedIndex()
+        index.insert(1)
+        with self.assertRaises(KeyError):
+            index.remove(2)
+        with self.assertRaises(KeyError):
+            index.index(0)
+
+
+class LeaderboardTestCase(TestCase):
+
+    def setUp(self):
+        self.leaderboard = Leaderboard()
+        self.alice, self.bob, self.carol = ('a', 'Alice'), ('b', 'Bob'), ('c', 'Carol')
+
+    def test_ratings(self):
+        self.leaderboard.record(self.alice, self.bob, 1)
+        self.assertEqual(self.leaderboard.ratings['a'], 1516)
+        self.assertEqual(self.leaderboard.ratings['b'], 1484)
+
+        self.leaderboard.record(self.alice, self.bob, 0.5)
+        self.assertLess(self.leaderboard.ratings['a'], 1516)
+
+    def test_ranks(self):
+        self.leaderboard.record(self.alice, self.bob, 1)
+        self.leaderboard.record(self.carol, self.bob, 1)
+        self.leaderboard.record(self.alice, self.carol, 1)
+
+        self.assertEqual([x['id'] for x in self.leaderboard.top(2)], ['a', 'c'])
+        self.assertEqual([x['rank'] for x in self.leaderboard.top(5, offset=1)], [2, 3])
+        self.assertEqual(self.leaderboard.get('b')['rank'], 3)
+        self.assertIsNone(self.leaderboard.get('unknown'))
@@ -0,0 +1,66 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from src.endpoints import REJECTED_FRAME, GameRoomEndpoint, MainServer
+from src.schemas import MakeMove, ValidationError
+
+from tests.fakes import FakeWebsocket
+
+
+class SchemaTestCase(TestCase):
+
+    def test_valid_payload(self):
+        data = MakeMove.validate({'x': 1, 'y': 2, 'extra': True})
+        self.assertEqual(data, {'x': 1, 'y': 2})
+
+    def test_invalid_payload(self):
+        for data in ({'x': 1}, {'x': '1', 'y': 0}, {'x': True, 'y': 0},
+                     {'x': -1, 'y': 0}, [1, 2], None):
+            with self.assertRaises(ValidationError):
+                MakeMove.validate(data)
+
+
+class DispatchTableTestCase(IsolatedAsyncioTestCase):
+
+    def test_dispatch_table(self):
+        self.assertEqual(set(MainServer.dispatch_methods),
+                         {'pong', 'chat_message', 'create_room'})
+        self.assertIn('make_move', GameRoomEndpoint.dispatch_methods)
+        self.assertNotIn('create_room', GameRoomEndpoint.dispatch_methods)
+
+    async def test_reject_invalid_events(self):
+        endpoint = GameRoomEndpoint({'type': 'websocket'}, None, None)
+        websocket = FakeWebsocket()
+        counts = dict(endpoint.reject_counts)
+
+        await endpoint.dispatch_request(websocket, {'event_type': 'create_room'})
+        await endpoint.dispatch_request(websocket, {
+            'event_type': 'make_move', 'data': {'x': 'a', 'y': 1}})
+
+        self.assertEqual([x['event_type'] for x in websocket.sent],
+                         ['event_rejected', 'event_rejected'])
+        for reason in ('unknown_event', 'invalid_data'):
+            self.assertEqual(endpoint.reject_counts[reason],
+                             counts.get(reason, 0) + 1)
+
+    async def test_reject_malformed_json(self):
+        endpoint = MainServer({'type': 'websocket'}, None, None)
+        websocket = FakeWebsocket()
+        count = endpoint.reject_counts['malformed_json']
+
+        data = await endpoint.decode(websocket, {'text': '{"event_type":'})
+
+        self.assertIs(data, REJECTED_FRAME)
+        self.assertEqual(websocket.sent[0]['event_type'], 'event_rejected')
+        self.assertEqual(endpoint.reject_counts['malformed_json'], count + 1)
+
+    async def test_reject_non_object_frames(self):
+        endpoint = MainServer({'type': 'websocket'}, None, None)
+        websocket = FakeWebsocket()
+        count = endpoint.reject_counts['not_an_object']
+
+        for data in ([], 5, 'x', None):
+            await endpoint.dispatch_request(websocket, data)
+
+        self.assertEqual([x['event_type'] for x in websocket.sent],
+                         ['event_rejected'] * 4)
+        self.assertEqual(endpoint.reject_counts['not_an_object'], count + 4)
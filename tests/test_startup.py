@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+# Seconds for `src` import and app construction in a fresh interpreter
+STARTUP_BUDGET = float(os.environ.get('STARTUP_BUDGET', 1.0))
+LAZY_MODULES = ('numpy', 'jinja2', 'aiohttp')
+
+STARTUP_SCRIPT = f'''
+import json, sys, time
+start = time.perf_counter()
+from src import create_app
+create_app()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [x for x in {LAZY_MODULES!r} if x in sys.modules],
+}}))
+'''
+
+
+class StartupTestCase(TestCase):
+
+    def test_startup_budget(self):
+        output = subprocess.run(
+            [sys.executable, '-W', 'ignore', '-c', STARTUP_SCRIPT],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, check=True, text=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+
+        self.assertEqual(result['loaded'], [])
+        self.assertLess(result['elapsed'], STARTUP_BUDGET)
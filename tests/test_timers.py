@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from src.timers import TimerWheel
+
+
+class TimerWheelTestCase(TestCase):
+
+    def setUp(self):
+        self.wheel = TimerWheel(tick=1.0, size=8, now=0.0)
+
+    def test_expire_in_order(self):
+        self.wheel.schedule('a', 3, now=0.0)
+        self.wheel.schedule('b', 1, now=0.0)
+        self.assertEqual(self.wheel.advance(0.5), [])
+        self.assertEqual(self.wheel.advance(1.0), ['b'])
+        self.assertEqual(self.wheel.advance(2.0), [])
+        self.assertEqual(self.wheel.advance(3.0), ['a'])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_delay_longer_than_wheel(self):
+        self.wheel.schedule('a', 20, now=0.0)
+        self.assertEqual(self.wheel.advance(19.0), [])
+        self.assertEqual(self.wheel.advance(20.0), ['a'])
+
+    def test_reschedule_and_cancel(self):
+        self.wheel.schedule('a', 2, now=0.0)
+        self.wheel.schedule('a', 5, now=1.0)
+        self.assertEqual(self.wheel.advance(5.0), [])
+        self.assertEqual(self.wheel.advance(6.0), ['a'])
+
+        self.wheel.schedule('b', 1, now=6.0)
+        self.assertTrue(self.wheel.cancel('b'))
+        self.assertFalse(self.wheel.cancel('b'))
+        self.assertEqual(self.wheel.advance(10.0), [])
+
+    def test_lagging_advance(self):
+        self.wheel.schedule('a', 2, now=0.0)
+        self.wheel.schedule('b', 4, now=3.5)
+        self.assertEqual(self.wheel.advance(30.0), ['a', 'b'])
+
+    def test_schedule_after_idle(self):
+        self.wheel.schedule('a', 2, now=86400.0)
+        self.assertEqual(self.wheel._time, 86400.0)
+        self.assertEqual(self.wheel.advance(86401.0), [])
+        self.assertEqual(self.wheel.advance(86402.0), ['a'])